@@ -43,20 +43,12 @@ class ResumeAnalyzer:
         length_score, length_issues = self.calculate_length_score(resume_text)
         
         # Step 3: Calculate overall weighted score (60% keywords, 20% format, 20% length)
-        overall_score = int(
-            keyword_score * 0.6 +
-            format_score * 0.2 + 
-            length_score * 0.2
-        )
+        overall_score = self.calculate_overall_score(keyword_score, format_score, length_score)
         
         print(f"DEBUG: Final scores - Overall: {overall_score}, Keywords: {keyword_score}")
         
         # Step 4: Generate simple recommendations
-        recommendations = []
-        if missing_keywords:
-            recommendations.append(f"Add keywords: {', '.join(missing_keywords[:3])}")
-        recommendations.append("Format analysis - coming next")
-        recommendations.append("Length analysis - coming after that")
+        recommendations = self.generate_recommendations(missing_keywords)
         
         return {
             'overall_score': overall_score,
@@ -65,9 +57,27 @@ class ResumeAnalyzer:
                 'format_score': format_score,
                 'length_score': length_score
             },
-            'recommendations': recommendations[:3]
+            'recommendations': recommendations
         }
     
+    def calculate_overall_score(self, keyword_score: int, format_score: int, length_score: int) -> int:
+        """Combine component scores with the weighted formula (60% keywords, 20% format, 20% length)"""
+        return int(
+            keyword_score * 0.6 +
+            format_score * 0.2 + 
+            length_score * 0.2
+        )
+    
+    def generate_recommendations(self, missing_keywords: List[str]) -> List[str]:
+        """Build the top 3 recommendations shown to the user"""
+        recommendations = []
+        if missing_keywords:
+            recommendations.append(f"Add keywords: {', '.join(missing_keywords[:3])}")
+        recommendations.append("Format analysis - coming next")
+        recommendations.append("Length analysis - coming after that")
+        
+        return recommendations[:3]
+    
     # TODO: We'll implement these methods one by one
     def calculate_keyword_score(self, resume_text: str, job_description: str) -> Tuple[int, List[str]]:
         """Calculate how well resume keywords match job description"""
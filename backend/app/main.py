@@ -1,10 +1,13 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import BackgroundTasks, FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 import time
 import base64
+import json
 from .models import AnalyzeRequest, AnalyzeResponse, ScoreBreakdown
 from .analyzer import ResumeAnalyzer
 from .parsers import FileParser
+from .recorder import TrafficRecorder
 
 # Create FastAPI application instance
 app = FastAPI(title="Resume Analyzer API", version="1.0.0")
@@ -13,6 +16,10 @@ app = FastAPI(title="Resume Analyzer API", version="1.0.0")
 analyzer = ResumeAnalyzer()
 file_parser = FileParser()
 
+# Opt-in traffic recording for replay testing (see replay_traffic.py).
+# Disabled unless RECORD_TRAFFIC_DIR is set, see TrafficRecorder.from_env.
+traffic_recorder = TrafficRecorder.from_env()
+
 # Configure CORS for local development
 origins = [
     "http://localhost:3000",    # React dev server
@@ -38,13 +45,15 @@ def health_check():
     return {"status": "healthy"}
 
 @app.post("/analyze", response_model=AnalyzeResponse)
-def analyze_resume(request: AnalyzeRequest):
+def analyze_resume(request: AnalyzeRequest, background_tasks: BackgroundTasks):
     """
     Analyze resume against job description and return score with recommendations.
     
     Uses the ResumeAnalyzer to perform keyword matching, format analysis,
     and length assessment to provide actionable feedback.
     """
+    # Traffic recording runs after the response is sent, off the timed path
+    background_tasks.add_task(traffic_recorder.maybe_record, request)
     start_time = time.time()
     
     try:
@@ -72,4 +81,79 @@ def analyze_resume(request: AnalyzeRequest):
         )
         
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}") 
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
+
+def format_sse_event(event: str, data: dict) -> str:
+    """Format a single Server-Sent Event message"""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+def stream_analysis_events(request: AnalyzeRequest):
+    """
+    Run the analysis stage by stage, yielding an SSE message after each one.
+    
+    Event order: parse_progress (one per page), parse_complete, keyword_score,
+    format_score, length_score, complete. Failures are reported as a final error event since
+    the 200 status has already been sent once streaming starts.
+    """
+    start_time = time.time()
+    
+    try:
+        # Stage 1: Parse the file, reporting progress after every page
+        print(f"DEBUG: Streaming analysis of {request.file_type.upper()} file")
+        progress = file_parser.iter_parse_file(request.resume_file, request.file_type)
+        for page in progress:
+            yield format_sse_event("parse_progress", page)
+        resume_text = progress.text
+        yield format_sse_event("parse_complete", {
+            "characters": len(resume_text),
+            "fallback": progress.fallback
+        })
+        
+        # Stage 2: Keyword matching
+        keyword_score, missing_keywords = analyzer.calculate_keyword_score(resume_text, request.job_description)
+        yield format_sse_event("keyword_score", {"keyword_score": keyword_score})
+        
+        # Stage 3: Format checks
+        format_score, format_issues = analyzer.calculate_format_score(resume_text)
+        yield format_sse_event("format_score", {"format_score": format_score})
+        
+        # Stage 4: Length analysis
+        length_score, length_issues = analyzer.calculate_length_score(resume_text)
+        yield format_sse_event("length_score", {"length_score": length_score})
+        
+        # Stage 5: Final score and recommendations, same shape as POST /analyze
+        response = AnalyzeResponse(
+            overall_score=analyzer.calculate_overall_score(keyword_score, format_score, length_score),
+            breakdown=ScoreBreakdown(
+                keyword_score=keyword_score,
+                format_score=format_score,
+                length_score=length_score
+            ),
+            recommendations=analyzer.generate_recommendations(missing_keywords),
+            processing_time_ms=int((time.time() - start_time) * 1000)
+        )
+        yield format_sse_event("complete", json.loads(response.json()))
+        
+    except Exception as e:
+        yield format_sse_event("error", {"detail": f"Analysis failed: {str(e)}"})
+
+@app.post("/analyze/stream")
+def analyze_resume_stream(request: AnalyzeRequest, background_tasks: BackgroundTasks):
+    """
+    Streaming variant of /analyze using Server-Sent Events.
+    
+    Each analysis stage is pushed to the client as soon as it completes. The
+    generator is advanced one stage at a time, so if the client disconnects
+    the remaining stages are never run and the worker is freed.
+    """
+    # Traffic recording runs after the stream ends, off the timed path
+    background_tasks.add_task(traffic_recorder.maybe_record, request)
+    return StreamingResponse(
+        stream_analysis_events(request),
+        background=background_tasks,
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"  # Stop reverse proxies from buffering events
+        }
+    )
@@ -1,6 +1,6 @@
 import base64
 import io
-from typing import Optional
+from typing import Dict, Generator, Iterable, Iterator, Optional, Tuple
 import PyPDF2
 from docx import Document
 
@@ -10,8 +10,13 @@ class FileParser:
     def __init__(self):
         print("FileParser initialized!")
     
-    def parse_pdf(self, pdf_content: bytes) -> str:
-        """Extract text from PDF file bytes"""
+    def iter_pdf_pages(self, pdf_content: bytes) -> Iterator[Dict]:
+        """
+        Extract text from PDF file bytes one page at a time
+
+        Yields a dict per page with page_number, total_pages and text, so
+        callers can report progress before the whole document is parsed.
+        """
         print(f"DEBUG: Parsing PDF file ({len(pdf_content)} bytes)")
         
         try:
@@ -20,21 +25,32 @@ class FileParser:
             
             # Create PDF reader
             pdf_reader = PyPDF2.PdfReader(pdf_file)
+            total_pages = len(pdf_reader.pages)
             
-            # Extract text from all pages
-            text = ""
+            # Extract text page by page
             for page_num, page in enumerate(pdf_reader.pages):
                 page_text = page.extract_text()
-                text += page_text + "\n"
                 print(f"DEBUG: Extracted {len(page_text)} characters from page {page_num + 1}")
-            
-            print(f"DEBUG: Total PDF text extracted: {len(text)} characters")
-            return text.strip()
+                yield {
+                    'page_number': page_num + 1,
+                    'total_pages': total_pages,
+                    'text': page_text
+                }
             
         except Exception as e:
             print(f"DEBUG: PDF parsing failed: {str(e)}")
             raise Exception(f"Failed to parse PDF: {str(e)}")
     
+    def parse_pdf(self, pdf_content: bytes) -> str:
+        """Extract text from PDF file bytes"""
+        return self.join_pdf_pages(page['text'] for page in self.iter_pdf_pages(pdf_content))
+    
+    def join_pdf_pages(self, page_texts: Iterable[str]) -> str:
+        """Combine extracted page texts into the full PDF text"""
+        text = "\n".join(page_texts).strip()
+        print(f"DEBUG: Total PDF text extracted: {len(text)} characters")
+        return text
+    
     def parse_docx(self, docx_content: bytes) -> str:
         """Extract text from DOCX file bytes"""
         print(f"DEBUG: Parsing DOCX file ({len(docx_content)} bytes)")
@@ -69,6 +85,27 @@ class FileParser:
         Returns:
             Extracted text content
         """
+        progress = self.iter_parse_file(file_content, file_type)
+        for _ in progress:
+            pass
+        return progress.text
+    
+    def iter_parse_file(self, file_content: str, file_type: str) -> 'ParseProgress':
+        """
+        Progressive version of parse_file
+        
+        Args:
+            file_content: Base64 encoded file content
+            file_type: Either 'pdf' or 'docx'
+        
+        Returns:
+            ParseProgress to iterate for per-page progress. Its text and
+            fallback attributes are set once iteration finishes.
+        """
+        return ParseProgress(self._parse_file_stages(file_content, file_type))
+    
+    def _parse_file_stages(self, file_content: str, file_type: str) -> Generator[Dict, None, Tuple[str, bool]]:
+        """Generator behind iter_parse_file, returns (text, used_plain_text_fallback)"""
         print(f"DEBUG: Starting file parsing for {file_type.upper()} file")
         
         try:
@@ -78,9 +115,19 @@ class FileParser:
             
             # Parse based on file type
             if file_type.lower() == 'pdf':
-                return self.parse_pdf(file_bytes)
+                page_texts = []
+                for page in self.iter_pdf_pages(file_bytes):
+                    page_texts.append(page['text'])
+                    yield {
+                        'page_number': page['page_number'],
+                        'total_pages': page['total_pages'],
+                        'characters': len(page['text'])
+                    }
+                return self.join_pdf_pages(page_texts), False
             elif file_type.lower() == 'docx':
-                return self.parse_docx(file_bytes)
+                text = self.parse_docx(file_bytes)
+                yield {'page_number': 1, 'total_pages': 1, 'characters': len(text)}
+                return text, False
             else:
                 raise Exception(f"Unsupported file type: {file_type}")
                 
@@ -90,6 +137,31 @@ class FileParser:
             try:
                 fallback_text = base64.b64decode(file_content).decode('utf-8')
                 print(f"DEBUG: Fallback to plain text successful")
-                return fallback_text
+                return fallback_text, True
             except:
-                raise Exception(f"Could not parse file as {file_type} or plain text: {str(e)}") 
\ No newline at end of file
+                raise Exception(f"Could not parse file as {file_type} or plain text: {str(e)}")
+
+class ParseProgress:
+    """
+    One-shot iterable of per-page progress dicts from FileParser.iter_parse_file
+    
+    text and fallback are only valid once the loop has run to the end: text
+    holds the extracted text and fallback is True if the file could not be
+    parsed and was read as plain text instead. Iterating a second time
+    raises RuntimeError since the parse has already been consumed.
+    """
+    
+    def __init__(self, stages: Generator[Dict, None, Tuple[str, bool]]):
+        self.stages = stages
+        self.started = False
+        self.text: Optional[str] = None
+        self.fallback = False
+    
+    def __iter__(self) -> Iterator[Dict]:
+        if self.started:
+            raise RuntimeError("ParseProgress can only be iterated once")
+        self.started = True
+        return self._run()
+    
+    def _run(self) -> Iterator[Dict]:
+        self.text, self.fallback = yield from self.stages
@@ -0,0 +1,189 @@
+import importlib
+import json
+import os
+import random
+import re
+import threading
+import time
+import uuid
+from typing import Callable, Dict, List, Optional
+
+# A redactor receives a record dict and returns the (possibly modified) record,
+# or None to drop the record entirely
+Redactor = Callable[[Dict], Optional[Dict]]
+
+EMAIL_PATTERN = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
+PHONE_PATTERN = r'(\d{3}[-.\s]*\d{3}[-.\s]*\d{4}|\(\d{3}\)\s*\d{3}[-.\s]*\d{4})'
+
+def redact_job_description_contacts(record: Dict) -> Dict:
+    """
+    Default redactor: scrub email addresses and phone numbers from the job description only
+
+    The resume file is left untouched, register another redactor to scrub or drop it.
+    """
+    job_description = re.sub(EMAIL_PATTERN, '[email]', record['job_description'])
+    record['job_description'] = re.sub(PHONE_PATTERN, '[phone]', job_description)
+    return record
+
+def load_redactor(spec: str) -> Redactor:
+    """Load a redactor from a 'module:function' spec, e.g. 'my_hooks:scrub_resume'"""
+    module_name, _, function_name = spec.partition(':')
+    if not module_name or not function_name:
+        raise ValueError(f"Redactor must look like 'module:function', got '{spec}'")
+    return getattr(importlib.import_module(module_name), function_name)
+
+class TrafficRecorder:
+    """
+    Captures a sample of /analyze requests into a local archive for replay testing
+
+    Records hold the resume file exactly as uploaded. Resume bytes are stored
+    unredacted (names, emails, phone numbers, addresses) unless a redactor
+    that handles resume_file is registered.
+    """
+
+    def __init__(self, archive_dir: Optional[str] = None, sample_rate: float = 0.0,
+                 max_records: int = 1000, max_archive_mb: float = 500,
+                 redactors: Optional[List[Redactor]] = None):
+        """
+        Args:
+            archive_dir: Directory to write recorded requests to. Recording is
+                disabled when this is not set.
+            sample_rate: Fraction of requests to record (0.0 - 1.0)
+            max_records: Stop recording once the archive holds this many records
+            max_archive_mb: Stop recording once the archive reaches this size
+            redactors: Hooks run on every record before it is written.
+                Defaults to [redact_job_description_contacts], which does
+                not touch the resume file.
+        """
+        self.archive_dir = archive_dir
+        self.sample_rate = max(0.0, min(sample_rate, 1.0))
+        self.max_records = max_records
+        self.max_archive_bytes = int(max_archive_mb * 1024 * 1024)
+        self.redactors: List[Redactor] = [redact_job_description_contacts] if redactors is None else list(redactors)
+        self.record_count = 0
+        self.archive_bytes = 0
+        self.lock = threading.Lock()
+
+        if self.enabled:
+            os.makedirs(self.archive_dir, exist_ok=True)
+            # Count what is already there so the caps hold across restarts
+            for file_name in os.listdir(self.archive_dir):
+                if file_name.endswith('.json'):
+                    self.record_count += 1
+                    self.archive_bytes += os.path.getsize(os.path.join(self.archive_dir, file_name))
+            print(f"TrafficRecorder initialized! Recording {self.sample_rate:.0%} of requests to {self.archive_dir}")
+
+    @classmethod
+    def from_env(cls) -> 'TrafficRecorder':
+        """
+        Build a recorder from environment variables
+
+        RECORD_TRAFFIC_DIR     archive directory (recording is off when unset)
+        RECORD_SAMPLE_RATE     fraction of requests to record (default 0.1)
+        RECORD_MAX_RECORDS     record count cap (default 1000)
+        RECORD_MAX_MB          archive size cap in MB (default 500)
+        RECORD_REDACTORS       comma separated 'module:function' hooks, run after
+                               the default job description redactor
+
+        Resume bytes are stored unredacted unless RECORD_REDACTORS includes a
+        hook that scrubs or drops resume_file. Any invalid setting disables
+        recording instead of failing startup.
+        """
+        archive_dir = os.getenv("RECORD_TRAFFIC_DIR")
+        if not archive_dir:
+            return cls()
+
+        try:
+            redactors = [redact_job_description_contacts]
+            for spec in os.getenv("RECORD_REDACTORS", "").split(','):
+                if spec.strip():
+                    redactors.append(load_redactor(spec.strip()))
+
+            return cls(
+                archive_dir=archive_dir,
+                sample_rate=float(os.getenv("RECORD_SAMPLE_RATE", "0.1")),
+                max_records=int(os.getenv("RECORD_MAX_RECORDS", "1000")),
+                max_archive_mb=float(os.getenv("RECORD_MAX_MB", "500")),
+                redactors=redactors
+            )
+        except Exception as e:
+            print(f"DEBUG: Invalid traffic recording settings, recording disabled: {str(e)}")
+            return cls()
+
+    @property
+    def enabled(self) -> bool:
+        """Recording only happens when an archive directory and a sample rate are configured"""
+        return bool(self.archive_dir) and self.sample_rate > 0
+
+    def add_redactor(self, redactor: Redactor) -> None:
+        """Register a hook that can scrub or drop a record before it is written"""
+        self.redactors.append(redactor)
+
+    def maybe_record(self, request) -> Optional[str]:
+        """
+        Record the request if recording is enabled and it is sampled
+
+        Args:
+            request: AnalyzeRequest with resume_file, file_type and job_description
+
+        Returns:
+            Path of the written record, or None if nothing was recorded
+        """
+        if not self.enabled or random.random() >= self.sample_rate:
+            return None
+
+        # Never let recording problems fail the user's request
+        request_id = uuid.uuid4().hex
+        try:
+            record = {
+                'request_id': request_id,
+                'recorded_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+                'file_type': request.file_type,
+                'job_description': request.job_description,
+                'resume_file': request.resume_file
+            }
+
+            for redactor in self.redactors:
+                record = redactor(record)
+                if record is None:
+                    print(f"DEBUG: Request dropped by redactor, not recorded")
+                    return None
+
+            data = json.dumps(record)
+
+            # Reserve space under the lock so concurrent requests can't overshoot the caps
+            with self.lock:
+                if (self.record_count >= self.max_records or
+                        self.archive_bytes + len(data) > self.max_archive_bytes):
+                    print(f"DEBUG: Traffic archive is full, not recorded")
+                    return None
+                self.record_count += 1
+                self.archive_bytes += len(data)
+
+        except Exception as e:
+            print(f"DEBUG: Traffic recording failed: {str(e)}")
+            return None
+
+        # Write to a temp file first so replay never sees a half-written record
+        file_name = f"{int(time.time() * 1000)}-{request_id}.json"
+        path = os.path.join(self.archive_dir, file_name)
+        tmp_path = path + '.tmp'
+        try:
+            with open(tmp_path, 'w') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+
+        except Exception as e:
+            print(f"DEBUG: Traffic recording failed: {str(e)}")
+            # Give back the reserved budget and don't leave a stray temp file
+            with self.lock:
+                self.record_count -= 1
+                self.archive_bytes -= len(data)
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return None
+
+        print(f"DEBUG: Recorded request to {path}")
+        return path
@@ -0,0 +1,3 @@
+# Lets tests import `app` and the scripts in this directory.
+# test_api.py is a manual script that needs a running server, not a pytest module.
+collect_ignore = ["test_api.py"]
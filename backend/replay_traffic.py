@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Replay recorded /analyze traffic against two versions of the backend code
+and compare latency, memory peaks and scores per request.
+
+Record traffic first by starting the server with RECORD_TRAFFIC_DIR set
+(see TrafficRecorder.from_env for sampling, caps and redaction hooks). Then check out the
+version to compare against, e.g. with git worktree, and run:
+
+    git worktree add ../baseline main
+    python replay_traffic.py traffic_archive --baseline ../baseline/backend --candidate .
+
+Each version runs in its own subprocess so the two copies of the `app`
+package never clash.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+SCORE_FIELDS = ['overall_score', 'keyword_score', 'format_score', 'length_score']
+
+def load_archive(archive_dir):
+    """Load all recorded requests from the archive, oldest first"""
+    records = []
+    for file_name in sorted(os.listdir(archive_dir)):
+        if not file_name.endswith('.json'):
+            continue
+        with open(os.path.join(archive_dir, file_name), 'r') as f:
+            records.append(json.load(f))
+    return records
+
+def run_worker(code_dir, archive_dir, output_path):
+    """Replay the archive once with the FileParser and ResumeAnalyzer found in code_dir"""
+    # Import the version under test, not the one next to this script
+    sys.path.insert(0, os.path.abspath(code_dir))
+    from app.parsers import FileParser
+    from app.analyzer import ResumeAnalyzer
+
+    file_parser = FileParser()
+    analyzer = ResumeAnalyzer()
+
+    def analyze(record):
+        resume_text = file_parser.parse_file(record['resume_file'], record['file_type'])
+        return analyzer.analyze_resume(resume_text, record['job_description'])
+
+    records = load_archive(archive_dir)
+
+    # Warm up lazy imports and regex caches so the first record isn't penalised
+    if records:
+        try:
+            analyze(records[0])
+        except Exception:
+            pass
+
+    results = []
+    for record in records:
+        result = {'request_id': record['request_id']}
+        try:
+            # Time the run without tracemalloc, it slows allocation down
+            start = time.perf_counter()
+            analysis = analyze(record)
+            latency_ms = (time.perf_counter() - start) * 1000
+
+            # One extra run to measure peak memory
+            tracemalloc.start()
+            analyze(record)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            result.update({
+                'latency_ms': latency_ms,
+                'peak_memory_kb': peak / 1024,
+                'overall_score': analysis['overall_score'],
+                'recommendations': analysis['recommendations'],
+                **analysis['breakdown']
+            })
+        except Exception as e:
+            if tracemalloc.is_tracing():
+                tracemalloc.stop()
+            result['error'] = str(e)
+        results.append(result)
+
+    with open(output_path, 'w') as f:
+        json.dump(results, f)
+
+def replay_version(code_dir, archive_dir):
+    """Run the worker for one code version in a subprocess and return its results"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        output_path = os.path.join(tmp_dir, 'results.json')
+        command = [
+            sys.executable, os.path.abspath(__file__), archive_dir,
+            '--worker', code_dir, '--output', output_path
+        ]
+        # Fix the hash seed: keyword matching iterates a set, so recommendation
+        # order would otherwise differ between the two subprocesses.
+        # The parser and analyzer print a lot of DEBUG output, keep it out of the report.
+        env = {**os.environ, 'PYTHONHASHSEED': '0'}
+        subprocess.run(command, check=True, stdout=subprocess.DEVNULL, env=env)
+        with open(output_path, 'r') as f:
+            return {result['request_id']: result for result in json.load(f)}
+
+def merge_rounds(rounds):
+    """Combine per-round worker results into one result per request with the median latency"""
+    merged = {}
+    for results in rounds:
+        for request_id, result in results.items():
+            if request_id not in merged:
+                merged[request_id] = {**result, 'latencies_ms': []}
+            current = merged[request_id]
+            if 'error' in result:
+                current['error'] = result['error']
+            elif 'error' not in current:
+                current['latencies_ms'].append(result['latency_ms'])
+                current['peak_memory_kb'] = max(current['peak_memory_kb'], result['peak_memory_kb'])
+
+    for result in merged.values():
+        if 'error' not in result:
+            result['latency_ms'] = statistics.median(result['latencies_ms'])
+    return merged
+
+def replay(baseline_dir, candidate_dir, archive_dir, repeat):
+    """
+    Replay the archive repeat times per version, alternating which version
+    goes first each round so warm-up and machine noise don't favour one side
+    """
+    baseline_rounds, candidate_rounds = [], []
+    for round_num in range(repeat):
+        if round_num % 2 == 0:
+            baseline_rounds.append(replay_version(baseline_dir, archive_dir))
+            candidate_rounds.append(replay_version(candidate_dir, archive_dir))
+        else:
+            candidate_rounds.append(replay_version(candidate_dir, archive_dir))
+            baseline_rounds.append(replay_version(baseline_dir, archive_dir))
+    return merge_rounds(baseline_rounds), merge_rounds(candidate_rounds)
+
+def compare(baseline, candidate, max_slowdown=None, min_slowdown_ms=5.0):
+    """
+    Print a per-request report
+
+    A request only counts as slow when it is more than max_slowdown percent
+    AND more than min_slowdown_ms slower, so sub-millisecond noise on fast
+    inputs doesn't fail the run.
+
+    Returns:
+        (regression found, number of requests compared)
+    """
+    regression = False
+    latency_deltas = []
+    failed_both = 0
+
+    print(f"{'request':<14}{'base ms':>10}{'cand ms':>10}{'delta':>9}{'base KB':>10}{'cand KB':>10}  scores")
+    print("-" * 80)
+
+    for request_id, base in baseline.items():
+        cand = candidate.get(request_id, {'error': 'missing from candidate run'})
+        label = request_id[:12]
+
+        if 'error' in base or 'error' in cand:
+            print(f"{label:<14}❌ baseline: {base.get('error', 'ok')} | candidate: {cand.get('error', 'ok')}")
+            if 'error' in cand:
+                # Failing in both versions is still a failure, not a skip
+                regression = True
+                if 'error' in base:
+                    failed_both += 1
+            continue
+
+        delta_ms = cand['latency_ms'] - base['latency_ms']
+        delta_pct = delta_ms / base['latency_ms'] * 100 if base['latency_ms'] else 0.0
+        latency_deltas.append(delta_pct)
+
+        score_diffs = [
+            f"{field} {base[field]}→{cand[field]}"
+            for field in SCORE_FIELDS if base[field] != cand[field]
+        ]
+        if base['recommendations'] != cand['recommendations']:
+            score_diffs.append("recommendations changed")
+
+        slow = max_slowdown is not None and delta_pct > max_slowdown and delta_ms > min_slowdown_ms
+        if score_diffs or slow:
+            regression = True
+
+        print(
+            f"{label:<14}{base['latency_ms']:>10.1f}{cand['latency_ms']:>10.1f}{delta_pct:>+8.1f}%"
+            f"{base['peak_memory_kb']:>10.0f}{cand['peak_memory_kb']:>10.0f}  "
+            f"{'; '.join(score_diffs) if score_diffs else 'same'}{' ⚠️ slow' if slow else ''}"
+        )
+
+    print("-" * 80)
+    if latency_deltas:
+        print(f"📊 {len(latency_deltas)} requests compared, median latency delta: {statistics.median(latency_deltas):+.1f}%")
+    if failed_both:
+        print(f"⚠️  {failed_both} requests failed in both versions")
+    return regression, len(latency_deltas)
+
+def positive_int(value):
+    """argparse type for counts that must be at least 1"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay recorded traffic against two backend versions")
+    parser.add_argument('archive', help="Directory written by the traffic recorder (RECORD_TRAFFIC_DIR)")
+    parser.add_argument('--baseline', help="Backend directory of the version to compare against")
+    parser.add_argument('--candidate', default='.', help="Backend directory of the new version (default: .)")
+    parser.add_argument('--repeat', type=positive_int, default=3,
+                        help="Replay rounds per version, alternating order; median latency is reported")
+    parser.add_argument('--max-slowdown', type=float, help="Fail if any request gets slower by more than this percent")
+    parser.add_argument('--min-slowdown-ms', type=float, default=5.0,
+                        help="Ignore slowdowns smaller than this many ms (default: 5)")
+    parser.add_argument('--worker', metavar='CODE_DIR', help=argparse.SUPPRESS)
+    parser.add_argument('--output', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args.worker, args.archive, args.output)
+        return
+
+    if not args.baseline:
+        parser.error("--baseline is required")
+
+    print(f"🔁 Replaying {args.archive}")
+    print(f"   baseline:  {args.baseline}")
+    print(f"   candidate: {args.candidate}\n")
+
+    baseline, candidate = replay(args.baseline, args.candidate, args.archive, args.repeat)
+    regression, compared = compare(baseline, candidate, args.max_slowdown, args.min_slowdown_ms)
+
+    if compared == 0:
+        print("❌ No requests could be compared, check the archive and both code versions")
+        sys.exit(1)
+    if regression:
+        print("❌ Regressions found")
+        sys.exit(1)
+    print("✅ No regressions found")
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,7 @@ import json
 
 # API endpoint
 API_URL = "http://127.0.0.1:8000/analyze"
+STREAM_URL = "http://127.0.0.1:8000/analyze/stream"
 
 def test_docx_file():
     """Test with real DOCX file"""
@@ -87,6 +88,50 @@ def test_pdf_file():
     except Exception as e:
         print(f"❌ PDF Test ERROR: {str(e)}")
 
+def test_pdf_stream():
+    """Test the SSE streaming endpoint with real PDF file"""
+    print("\n🧪 Testing streaming analysis...")
+    
+    # Read the base64 content
+    with open('test_files/pdf_base64.txt', 'r') as f:
+        pdf_base64 = f.read().strip()
+    
+    # Prepare request
+    request_data = {
+        "resume_file": pdf_base64,
+        "file_type": "pdf",
+        "job_description": "Seeking a Senior Software Developer with Python, FastAPI, and team leadership experience. Must have database optimization skills and CI/CD experience."
+    }
+    
+    try:
+        # Send request and print each event as it arrives
+        print(f"📤 Sending request to {STREAM_URL}")
+        response = requests.post(STREAM_URL, json=request_data, stream=True, timeout=30)
+        
+        if response.status_code != 200:
+            print(f"❌ Stream Test FAILED: {response.status_code}")
+            print(f"Error: {response.text}")
+            return
+        
+        event = None
+        for line in response.iter_lines(decode_unicode=True):
+            if line.startswith("event: "):
+                event = line[len("event: "):]
+            elif line.startswith("data: "):
+                data = json.loads(line[len("data: "):])
+                print(f"📨 {event}: {data}")
+                if event == "error":
+                    print("❌ Stream Test FAILED")
+                    return
+                if event == "complete":
+                    print("✅ Stream Test SUCCESSFUL!")
+                    return
+        
+        print("❌ Stream Test FAILED: stream ended without a complete event")
+            
+    except Exception as e:
+        print(f"❌ Stream Test ERROR: {str(e)}")
+
 def check_server():
     """Check if server is running"""
     try:
@@ -114,5 +159,6 @@ if __name__ == "__main__":
     # Run tests
     test_docx_file()
     test_pdf_file()
+    test_pdf_stream()
     
     print("\n🎉 Testing complete!") 
\ No newline at end of file
@@ -0,0 +1,41 @@
+import base64
+import os
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("PyPDF2")
+
+from fastapi import BackgroundTasks
+
+from app import main
+from app.models import AnalyzeRequest
+from app.recorder import TrafficRecorder
+
+@pytest.fixture
+def recorder(tmp_path, monkeypatch):
+    recorder = TrafficRecorder(str(tmp_path), sample_rate=1.0)
+    monkeypatch.setattr(main, 'traffic_recorder', recorder)
+    return recorder
+
+@pytest.fixture
+def request_body():
+    return AnalyzeRequest(
+        resume_file=base64.b64encode(b'Plain text resume').decode(),
+        file_type='pdf',
+        job_description="Python developer"
+    )
+
+@pytest.mark.parametrize("endpoint", [main.analyze_resume, main.analyze_resume_stream])
+def test_recording_is_deferred_to_background_task(endpoint, recorder, request_body, tmp_path):
+    background_tasks = BackgroundTasks()
+    endpoint(request_body, background_tasks)
+
+    # Nothing is written while the request is being handled
+    assert os.listdir(tmp_path) == []
+    assert [task.func for task in background_tasks.tasks] == [recorder.maybe_record]
+
+def test_stream_response_runs_recording_after_stream(recorder, request_body):
+    background_tasks = BackgroundTasks()
+    response = main.analyze_resume_stream(request_body, background_tasks)
+    assert response.background is background_tasks
@@ -0,0 +1,95 @@
+import base64
+import os
+
+import pytest
+
+pytest.importorskip("PyPDF2")
+pytest.importorskip("docx")
+
+from app.parsers import FileParser
+
+TEST_FILES = os.path.join(os.path.dirname(__file__), '..', 'test_files')
+
+def encode(data: bytes) -> str:
+    return base64.b64encode(data).decode()
+
+@pytest.fixture
+def parser():
+    return FileParser()
+
+@pytest.fixture
+def sample_pdf():
+    with open(os.path.join(TEST_FILES, 'sample_resume.pdf'), 'rb') as f:
+        return encode(f.read())
+
+class FakePage:
+    def __init__(self, text):
+        self.text = text
+
+    def extract_text(self):
+        if self.text is None:
+            raise ValueError("corrupt page")
+        return self.text
+
+def fake_reader(page_texts):
+    class FakePdfReader:
+        def __init__(self, pdf_file):
+            self.pages = [FakePage(text) for text in page_texts]
+    return FakePdfReader
+
+def test_iter_parse_file_reports_each_pdf_page(parser, sample_pdf):
+    progress = parser.iter_parse_file(sample_pdf, 'pdf')
+    pages = list(progress)
+
+    assert pages
+    assert [page['page_number'] for page in pages] == list(range(1, len(pages) + 1))
+    assert all(page['total_pages'] == len(pages) for page in pages)
+    assert progress.text == parser.parse_file(sample_pdf, 'pdf')
+    assert not progress.fallback
+
+def test_iter_parse_file_docx_is_one_page(parser):
+    with open(os.path.join(TEST_FILES, 'sample_resume.docx'), 'rb') as f:
+        docx_file = encode(f.read())
+
+    progress = parser.iter_parse_file(docx_file, 'docx')
+    pages = list(progress)
+
+    assert pages == [{'page_number': 1, 'total_pages': 1, 'characters': len(progress.text)}]
+    assert progress.text == parser.parse_file(docx_file, 'docx')
+
+def test_iter_parse_file_joins_pages(parser, monkeypatch):
+    monkeypatch.setattr('app.parsers.PyPDF2.PdfReader', fake_reader(["first page", "second page"]))
+
+    progress = parser.iter_parse_file(encode(b'%PDF'), 'pdf')
+    assert list(progress) == [
+        {'page_number': 1, 'total_pages': 2, 'characters': 10},
+        {'page_number': 2, 'total_pages': 2, 'characters': 11}
+    ]
+    assert progress.text == "first page\nsecond page"
+
+def test_iter_parse_file_plain_text_fallback(parser):
+    progress = parser.iter_parse_file(encode(b'Plain text resume'), 'pdf')
+
+    assert list(progress) == []
+    assert progress.text == 'Plain text resume'
+    assert progress.fallback
+
+def test_iter_parse_file_fallback_after_partial_pages(parser, monkeypatch):
+    monkeypatch.setattr('app.parsers.PyPDF2.PdfReader', fake_reader(["first page", None]))
+
+    progress = parser.iter_parse_file(encode(b'Plain text resume'), 'pdf')
+
+    assert [page['page_number'] for page in progress] == [1]
+    assert progress.text == 'Plain text resume'
+    assert progress.fallback
+
+def test_iter_parse_file_unparseable_raises(parser):
+    with pytest.raises(Exception, match="Could not parse file"):
+        list(parser.iter_parse_file(encode(b'\xff\xfe\x00garbage'), 'docx'))
+
+def test_parse_progress_is_one_shot(parser):
+    progress = parser.iter_parse_file(encode(b'Plain text resume'), 'pdf')
+    list(progress)
+
+    with pytest.raises(RuntimeError):
+        list(progress)
@@ -0,0 +1,92 @@
+import json
+import os
+from types import SimpleNamespace
+
+from app.recorder import TrafficRecorder
+
+def make_request(job_description="Python developer, contact jane@example.com or 555-123-4567"):
+    return SimpleNamespace(resume_file="aGVsbG8=", file_type="pdf", job_description=job_description)
+
+def test_disabled_without_archive_dir(tmp_path):
+    recorder = TrafficRecorder(sample_rate=1.0)
+    assert not recorder.enabled
+    assert recorder.maybe_record(make_request()) is None
+
+def test_sampling_skips_requests(tmp_path, monkeypatch):
+    recorder = TrafficRecorder(str(tmp_path), sample_rate=0.5)
+    monkeypatch.setattr('app.recorder.random.random', lambda: 0.9)
+    assert recorder.maybe_record(make_request()) is None
+    monkeypatch.setattr('app.recorder.random.random', lambda: 0.1)
+    assert recorder.maybe_record(make_request()) is not None
+
+def test_default_redactor_only_scrubs_job_description(tmp_path):
+    recorder = TrafficRecorder(str(tmp_path), sample_rate=1.0)
+    path = recorder.maybe_record(make_request())
+
+    with open(path) as f:
+        record = json.load(f)
+    assert record['job_description'] == "Python developer, contact [email] or [phone]"
+    # The resume itself is archived unredacted
+    assert record['resume_file'] == "aGVsbG8="
+    assert record['file_type'] == "pdf"
+    # Atomic write leaves no temp files behind
+    assert os.listdir(tmp_path) == [os.path.basename(path)]
+
+def test_redactor_can_modify_or_drop(tmp_path):
+    recorder = TrafficRecorder(str(tmp_path), sample_rate=1.0)
+    recorder.add_redactor(lambda record: {**record, 'resume_file': ''})
+    with open(recorder.maybe_record(make_request())) as f:
+        assert json.load(f)['resume_file'] == ''
+
+    recorder.add_redactor(lambda record: None)
+    assert recorder.maybe_record(make_request()) is None
+    assert len(os.listdir(tmp_path)) == 1
+
+def test_failing_redactor_does_not_raise(tmp_path):
+    recorder = TrafficRecorder(str(tmp_path), sample_rate=1.0, redactors=[lambda record: 1 / 0])
+    assert recorder.maybe_record(make_request()) is None
+    assert os.listdir(tmp_path) == []
+
+def test_record_cap_counts_existing_archive(tmp_path):
+    TrafficRecorder(str(tmp_path), sample_rate=1.0).maybe_record(make_request())
+
+    recorder = TrafficRecorder(str(tmp_path), sample_rate=1.0, max_records=2)
+    assert recorder.maybe_record(make_request()) is not None
+    assert recorder.maybe_record(make_request()) is None
+    assert len(os.listdir(tmp_path)) == 2
+
+def test_size_cap(tmp_path):
+    recorder = TrafficRecorder(str(tmp_path), sample_rate=1.0, max_archive_mb=0.0005)
+    assert recorder.maybe_record(make_request()) is not None
+    assert recorder.maybe_record(make_request(job_description="x" * 200)) is None
+
+def test_failed_write_releases_budget(tmp_path, monkeypatch):
+    recorder = TrafficRecorder(str(tmp_path), sample_rate=1.0, max_records=1)
+
+    def failing_replace(src, dst):
+        raise OSError("disk full")
+    monkeypatch.setattr('app.recorder.os.replace', failing_replace)
+    assert recorder.maybe_record(make_request()) is None
+    assert os.listdir(tmp_path) == []
+    assert recorder.record_count == 0
+    assert recorder.archive_bytes == 0
+
+    monkeypatch.undo()
+    assert recorder.maybe_record(make_request()) is not None
+
+def test_from_env_invalid_settings_disable_recording(tmp_path, monkeypatch):
+    monkeypatch.setenv("RECORD_TRAFFIC_DIR", str(tmp_path))
+    monkeypatch.setenv("RECORD_SAMPLE_RATE", "ten percent")
+    assert not TrafficRecorder.from_env().enabled
+
+    monkeypatch.setenv("RECORD_SAMPLE_RATE", "1")
+    monkeypatch.setenv("RECORD_REDACTORS", "no_such_module:scrub")
+    assert not TrafficRecorder.from_env().enabled
+
+def test_from_env_loads_redactors(tmp_path, monkeypatch):
+    monkeypatch.setenv("RECORD_TRAFFIC_DIR", str(tmp_path))
+    monkeypatch.setenv("RECORD_SAMPLE_RATE", "1")
+    monkeypatch.setenv("RECORD_REDACTORS", "app.recorder:redact_job_description_contacts")
+    recorder = TrafficRecorder.from_env()
+    assert recorder.enabled
+    assert len(recorder.redactors) == 2
@@ -0,0 +1,93 @@
+import json
+
+import pytest
+
+import replay_traffic
+
+# Stand-in for app/analyzer.py: like calculate_keyword_score, its
+# recommendations depend on set iteration order
+STUB_ANALYZER = '''
+class ResumeAnalyzer:
+    def analyze_resume(self, resume_text, job_description):
+        missing = [word for word in set(job_description.split()) if word not in resume_text]
+        return {
+            'overall_score': 50,
+            'breakdown': {'keyword_score': 50, 'format_score': %d, 'length_score': 50},
+            'recommendations': [f"Add keywords: {', '.join(missing[:3])}"]
+        }
+'''
+
+STUB_PARSER = '''
+import base64
+
+class FileParser:
+    def parse_file(self, file_content, file_type):
+        return base64.b64decode(file_content).decode('utf-8')
+'''
+
+def make_code_dir(path, format_score=50):
+    (path / 'app').mkdir(parents=True)
+    (path / 'app' / 'parsers.py').write_text(STUB_PARSER)
+    (path / 'app' / 'analyzer.py').write_text(STUB_ANALYZER % format_score)
+    return str(path)
+
+def make_archive(path):
+    path.mkdir()
+    job_description = ' '.join(f"skill{i}" for i in range(30))
+    for i in range(3):
+        record = {'request_id': f"req{i}", 'file_type': 'pdf',
+                  'job_description': job_description, 'resume_file': 'c2tpbGwx'}
+        (path / f"{i}.json").write_text(json.dumps(record))
+    return str(path)
+
+def result(latency_ms=10.0, **overrides):
+    base = {'latency_ms': latency_ms, 'peak_memory_kb': 100.0, 'overall_score': 70,
+            'keyword_score': 60, 'format_score': 80, 'length_score': 100,
+            'recommendations': ["Add keywords: python"]}
+    return {**base, **overrides}
+
+def test_compare_identical_results():
+    regression, compared = replay_traffic.compare({'a': result()}, {'a': result()})
+    assert not regression
+    assert compared == 1
+
+def test_compare_score_change_is_regression():
+    regression, _ = replay_traffic.compare({'a': result()}, {'a': result(keyword_score=40)})
+    assert regression
+
+def test_compare_ignores_slowdown_below_noise_floor():
+    baseline, candidate = {'a': result(latency_ms=0.5)}, {'a': result(latency_ms=0.9)}
+    regression, _ = replay_traffic.compare(baseline, candidate, max_slowdown=10, min_slowdown_ms=5)
+    assert not regression
+
+    baseline, candidate = {'a': result(latency_ms=50)}, {'a': result(latency_ms=100)}
+    regression, _ = replay_traffic.compare(baseline, candidate, max_slowdown=10, min_slowdown_ms=5)
+    assert regression
+
+def test_compare_failure_in_both_versions_is_not_skipped():
+    regression, compared = replay_traffic.compare({'a': {'error': 'boom'}}, {'a': {'error': 'boom'}})
+    assert regression
+    assert compared == 0
+
+def test_repeat_must_be_positive():
+    with pytest.raises(Exception):
+        replay_traffic.positive_int('0')
+    assert replay_traffic.positive_int('2') == 2
+
+def test_replay_same_code_has_no_regressions(tmp_path):
+    code_dir = make_code_dir(tmp_path / 'code')
+    archive = make_archive(tmp_path / 'archive')
+
+    baseline, candidate = replay_traffic.replay(code_dir, code_dir, archive, repeat=2)
+    regression, compared = replay_traffic.compare(baseline, candidate)
+    assert compared == 3
+    assert not regression
+
+def test_replay_detects_score_change(tmp_path):
+    baseline_dir = make_code_dir(tmp_path / 'baseline')
+    candidate_dir = make_code_dir(tmp_path / 'candidate', format_score=60)
+    archive = make_archive(tmp_path / 'archive')
+
+    baseline, candidate = replay_traffic.replay(baseline_dir, candidate_dir, archive, repeat=1)
+    regression, _ = replay_traffic.compare(baseline, candidate)
+    assert regression
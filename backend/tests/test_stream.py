@@ -0,0 +1,56 @@
+import base64
+import json
+import os
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("PyPDF2")
+
+from app.main import stream_analysis_events
+from app.models import AnalyzeRequest
+
+TEST_FILES = os.path.join(os.path.dirname(__file__), '..', 'test_files')
+JOB_DESCRIPTION = "Seeking a Senior Software Developer with Python, FastAPI, and team leadership experience."
+
+def parse_events(stream):
+    """Turn raw SSE messages into (event, data) tuples"""
+    events = []
+    for message in stream:
+        event_line, data_line = message.strip().split('\n')
+        events.append((event_line[len('event: '):], json.loads(data_line[len('data: '):])))
+    return events
+
+def make_request(file_bytes: bytes, file_type: str) -> AnalyzeRequest:
+    return AnalyzeRequest(
+        resume_file=base64.b64encode(file_bytes).decode(),
+        file_type=file_type,
+        job_description=JOB_DESCRIPTION
+    )
+
+def test_stream_event_order():
+    with open(os.path.join(TEST_FILES, 'sample_resume.pdf'), 'rb') as f:
+        events = parse_events(stream_analysis_events(make_request(f.read(), 'pdf')))
+    names = [name for name, _ in events]
+
+    page_events = names.index('parse_complete')
+    assert page_events >= 1
+    assert set(names[:page_events]) == {'parse_progress'}
+    assert names[page_events:] == ['parse_complete', 'keyword_score', 'format_score', 'length_score', 'complete']
+    assert events[page_events][1]['fallback'] is False
+
+    complete = events[-1][1]
+    assert complete['breakdown']['keyword_score'] == events[-4][1]['keyword_score']
+    assert set(complete) == {'overall_score', 'breakdown', 'recommendations', 'processing_time_ms'}
+
+def test_stream_reports_plain_text_fallback():
+    events = parse_events(stream_analysis_events(make_request(b'Plain text resume', 'pdf')))
+
+    assert events[0] == ('parse_complete', {'characters': 17, 'fallback': True})
+    assert events[-1][0] == 'complete'
+
+def test_stream_ends_with_error_when_parsing_fails():
+    events = parse_events(stream_analysis_events(make_request(b'\xff\xfe\x00garbage', 'docx')))
+
+    assert [name for name, _ in events] == ['error']
+    assert events[0][1]['detail'].startswith('Analysis failed:')